@@ -696,19 +696,22 @@ class CARNIVORES_OT_resync_animation(bpy.types.Operator):
             else:
                 anim_base_name = action.name
             
-            anim_utils.keyframe_shape_key_animation_as_action(
+            result = anim_utils.keyframe_shape_key_animation_as_action(
                 obj, 
                 anim_base_name, 
                 frame_start=1, 
                 kps=kps, 
                 scene_fps=context.scene.render.fps
             )
+            # The re-bake reports its own frame range
+            frame_range = result[1:] if result else None
         else:
             # STANDARD LOGIC
             anim_utils.rescale_standard_action(action, kps, context.scene.render.fps)
+            frame_range = None
         
         # Update NLA Strips
-        strip_updated = self.update_nla_strip(obj, action)
+        strip_updated = self.update_nla_strip(obj, action, frame_range)
         
         # Clear Active Action if it matches (to prevent double-transform)
         for ad in self.get_anim_data(obj):
@@ -721,7 +724,7 @@ class CARNIVORES_OT_resync_animation(bpy.types.Operator):
         self.report({'INFO'}, f"Resynced '{action.name}' at {kps} KPS.")
         return {'FINISHED'}
         
-    def update_nla_strip(self, obj, action):
+    def update_nla_strip(self, obj, action, frame_range=None):
         updated = False
         datas = self.get_anim_data(obj)
         for anim_data in datas:
@@ -729,7 +732,9 @@ class CARNIVORES_OT_resync_animation(bpy.types.Operator):
                 for track in anim_data.nla_tracks:
                     for strip in track.strips:
                         if strip.action == action:
-                            start, end = anim_utils.get_action_frame_range(action)
+                            if frame_range is None:
+                                frame_range = anim_utils.get_action_frame_range(action)
+                            start, end = frame_range
                             # Update Strip
                             strip.action_frame_start = start
                             strip.action_frame_end = end
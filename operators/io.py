@@ -158,8 +158,8 @@ class CARNIVORES_OT_import_3df(bpy.types.Operator, bpy_extras.io_utils.ImportHel
                 mesh_name, object_name = io_utils.generate_names(filepath)
                 coll = io_utils.create_import_collection(object_name)
                 header, faces, uvs, vertices, bones, bone_names, texture, texture_height, warnings = parse_3df(filepath, self.validate, self.import_textures, flip_handedness=self.flip_handedness)
-                verticesTransformedPos = io_utils.apply_import_matrix(vertices['coord'], import_matrix_np)
-                bonesTransformedPos = io_utils.apply_import_matrix(bones['pos'], import_matrix_np)
+                verticesTransformedPos = io_utils.apply_import_matrix(vertices['coord'], import_matrix_np, dtype=np.float32)
+                bonesTransformedPos = io_utils.apply_import_matrix(bones['pos'], import_matrix_np, dtype=np.float32)
 
                 obj = io_utils.create_mesh_object(
                     mesh_name,
@@ -603,7 +603,7 @@ class CARNIVORES_OT_import_car(bpy.types.Operator, bpy_extras.io_utils.ImportHel
                     debug(f"  -> {s['name']} {s['data'].size} samples")
                 debug(f"CROSS_REF (first 10): {cross_ref[:10]}")
                 
-                verticesTransformedPos = io_utils.apply_import_matrix(vertices['coord'], import_matrix_np)
+                verticesTransformedPos = io_utils.apply_import_matrix(vertices['coord'], import_matrix_np, dtype=np.float32)
                 # Use bone_names from parser (already handles dummies/offset if needed)
                 obj = io_utils.create_mesh_object(mesh_name, verticesTransformedPos, faces['v'], model_name, self.normal_smooth, faces['flags'])
                 coll.objects.link(obj)
@@ -74,7 +74,10 @@ def parse_car_animations(file, header, context):
                 warn(f"Truncated {ani_name} (skipping)")
                 continue
             # Decode to absolute positions (float32)
-            positions = raw_data.reshape(frames_count, vcount, 3).astype(np.float32) / 16.0
+            # astype gives a fresh C-contiguous float32 tensor; scale it in place
+            # instead of allocating a second (F, V, 3) array for the division
+            positions = raw_data.reshape(frames_count, vcount, 3).astype(np.float32)
+            positions *= np.float32(1.0 / 16.0)
             animations.append({
                 'name': ani_name,
                 'kps': int(ani_kps),
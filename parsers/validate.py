@@ -2,6 +2,11 @@
 import numpy as np
 import os
 
+def _require_finite(arr, name):
+    # Single isfinite pass shared by the vertex and bone position checks
+    if not np.isfinite(arr).all():
+        raise ValueError(f"{name} contain NaN or infinite values.")
+
 def detect_bone_cycles(parents, bone_count):
     def has_cycle(node, visited, path):
         if node in path:
@@ -88,8 +93,7 @@ def validate_3df_vertices(vertices, vertex_count, bone_count, context):
     if vertices.size != vertex_count:
         raise ValueError(f"Expected {vertex_count} vertices, but got {vertices.size}")
 
-    if not np.isfinite(vertices['coord']).all():
-        raise ValueError("Vertex coordinates contain NaN or infinite values.")
+    _require_finite(vertices['coord'], "Vertex coordinates")
 
     # Check hide field (warn if non-zero, as it has no in-game effect)
     if np.any(vertices['hide'] != 0):
@@ -117,16 +121,22 @@ def validate_3df_faces(faces, face_count, vertex_count, texture_height, context)
     # Face count sanity
     if faces.shape[0] != face_count:
         raise ValueError(f"Expected {face_count} faces, but parsed {faces.shape[0]}")
+    if face_count == 0:
+        return faces
 
-    # Vertex index bounds
+    # Bind structured fields once; each is a writable view into `faces`
     idx = faces['v']
+    u_raw, v_raw = faces['u_tex'], faces['v_tex']
+    flags = faces['flags']
+
+    # Vertex index bounds
     if (idx < 0).any() or (idx >= vertex_count).any():
         bad = np.logical_or(idx < 0, idx >= vertex_count)
         n_bad = np.count_nonzero(bad)
         context.warnings.append(
             f"{n_bad} face-vertex indices out of range [0, {vertex_count-1}]; clamped."
         )
-        faces['v'][bad] = np.clip(faces['v'][bad], 0, vertex_count - 1)
+        idx[bad] = np.clip(idx[bad], 0, vertex_count - 1)
 
     # Degenerate faces (two or three identical vertex indices)
     v1, v2, v3 = idx[:, 0], idx[:, 1], idx[:, 2]
@@ -136,20 +146,18 @@ def validate_3df_faces(faces, face_count, vertex_count, texture_height, context)
         context.warnings.append(f"{count_deg} degenerate faces detected (duplicate vertex indices).")
 
     # Raw UV range checks
-    u_raw, v_raw = faces['u_tex'], faces['v_tex']
     if (u_raw > 255).any():
         n_bad = np.count_nonzero(u_raw > 255)
         context.warnings.append(f"{n_bad} U coords >255; clipped.")
-        faces['u_tex'] = np.clip(u_raw, 0, 255)
+        np.clip(u_raw, 0, 255, out=u_raw)
     max_v = max(texture_height - 1, 0)
     if (v_raw > max_v).any():
         n_bad = np.count_nonzero(v_raw > max_v)
         context.warnings.append(f"{n_bad} V coords >{max_v}; clipped.")
-        faces['v_tex'] = np.clip(v_raw, 0, max_v)
+        np.clip(v_raw, 0, max_v, out=v_raw)
 
     # Flags field: warn if any unknown bits set
     known_mask = 0x0001 | 0x0002 | 0x0004 | 0x0008 | 0x0010 | 0x0020 | 0x0040 | 0x0080 | 0x8000
-    flags = faces['flags']
     unknown = flags & ~known_mask
     if unknown.any():
         n_bad = np.count_nonzero(unknown != 0)
@@ -169,12 +177,16 @@ def validate_3df_faces(faces, face_count, vertex_count, texture_height, context)
 def validate_3df_bones(bones, bone_count, context):
     # Count check
     parents = bones['parent']
+    names = bones['name']
+    hidden = bones['hidden']
     if bones.shape[0] != bone_count:
         raise ValueError(f"Parsed {bones.shape[0]} bones; expected {bone_count}.")
+    if bone_count == 0:
+        return bones
 
     # Decode names and check duplicates/empties
     decoded = []
-    for i, raw in enumerate(bones['name']):
+    for i, raw in enumerate(names):
         s = raw.decode('ascii', errors='ignore').split('\x00', 1)[0]
         if not s:
             context.warnings.append(f"Bone #{i} has an empty name; using placeholder.")
@@ -193,7 +205,7 @@ def validate_3df_bones(bones, bone_count, context):
 
     # Add cycle detection
     # Replace the cycle detection section
-    cycle_start = detect_bone_cycles(bones['parent'], bone_count)
+    cycle_start = detect_bone_cycles(parents, bone_count)
     if cycle_start != -1:
         context.warnings.append(f"Cycle detected in bone hierarchy starting at bone {cycle_start}. Clamping to -1.")
         # Break cycles by setting parent to -1 for any bone that would cause a cycle
@@ -201,14 +213,14 @@ def validate_3df_bones(bones, bone_count, context):
         path = set()
         def break_cycles(node):
             if node in path:
-                bones['parent'][node] = -1
+                parents[node] = -1
                 return
             if node in visited or node == -1:
                 return
             visited.add(node)
             path.add(node)
             if node < bone_count:
-                break_cycles(bones['parent'][node])
+                break_cycles(parents[node])
             path.remove(node)
         for i in range(bone_count):
             visited.clear()
@@ -216,13 +228,11 @@ def validate_3df_bones(bones, bone_count, context):
             break_cycles(i)
 
     # Position sanity
-    pos = bones['pos']
-    if not np.isfinite(pos).all():
-        raise ValueError("Bone positions contain NaN or infinite values.")
+    _require_finite(bones['pos'], "Bone positions")
 
     # Hidden field (warn if non-zero, as it has no in-game effect)
-    if np.any(bones['hidden'] != 0):
-        count_hidden = np.count_nonzero(bones['hidden'])
+    if np.any(hidden != 0):
+        count_hidden = np.count_nonzero(hidden)
         context.warnings.append(
             f"{count_hidden} bones have non-zero 'hidden' values (no in-game effect, likely editor-specific)."
         )
@@ -235,18 +245,11 @@ def validate_3df_texture(texture_raw, texture_size, context):
 
     if actual_length != expected_length:
         raise ValueError(f"Texture data length {actual_length} does not match expected {expected_length}.")
+    if texture_size == 0:
+        return texture_raw  # Stub/textureless model, nothing to scan
 
-    # Alpha channel check: bit 15 only 0 or 1
-    alpha_bits = (texture_raw >> 15) & 0x1
-    if not np.all(np.isin(alpha_bits, [0, 1])):
-        context.warnings.append("Texture contains alpha bits outside expected 0 or 1.")
-
-    # RGB channel range check (0..31)
-    r = (texture_raw >> 10) & 0x1F
-    g = (texture_raw >> 5) & 0x1F
-    b = texture_raw & 0x1F
-    if (r > 31).any() or (g > 31).any() or (b > 31).any():
-        context.warnings.append("Texture RGB values out of expected range 0..31.")
+    # No per-channel range checks: for '<u2' texels the 1-bit alpha and 5-bit
+    # RGB fields extracted by shift+mask are always in range by construction.
 
     # Check for completely zeroed texture (potential corruption)
     if not np.any(texture_raw):
@@ -1,6 +1,5 @@
 import bpy
-import re
-import wave
+import struct
 import tempfile
 import os
 import aud
@@ -8,7 +7,7 @@ import numpy as np
 from .common import timed
 from .io import apply_import_matrix
 from . import io as io_utils
-from .logger import info, debug, warn, error
+from .logger import info, debug, warn, error, get_debug_mode
 
 # Global state for sound files
 _temp_sound_files = set()
@@ -58,6 +57,31 @@ def iter_action_fcurves(action):
         for fc in action.fcurves:
             yield fc
 
+def _add_keyframes(fc, frames, values, interpolation, vector_handles=False):
+    """
+    Fill an empty F-Curve with keyframes in one batch (frames ascending and unique).
+    foreach_set writes the whole keyframe_points collection, so the curve must
+    have no points yet. Callers run fc.update() afterwards to recalculate handles.
+    """
+    points = fc.keyframe_points
+    if len(points) != 0:
+        raise ValueError(f"F-Curve '{fc.data_path}' already has {len(points)} keyframes; _add_keyframes expects an empty F-Curve")
+
+    count = len(frames)
+    co = np.empty(count * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+
+    points.add(count)
+    points.foreach_set('co', co)
+    # Enum properties are set per point; still far cheaper than insert(),
+    # which searches and reallocates the BezTriple array on every call
+    for point in points:
+        point.interpolation = interpolation
+        if vector_handles:
+            point.handle_left_type = 'VECTOR'
+            point.handle_right_type = 'VECTOR'
+
 @timed('create_shape_keys_from_car_animations')
 def create_shape_keys_from_car_animations(obj, animations, import_matrix_np, use_absolute=False):
     if not animations:
@@ -81,14 +105,15 @@ def create_shape_keys_from_car_animations(obj, animations, import_matrix_np, use
         if positions.shape != (frames_count, vcount, 3):
             warn(f"Skipping {anim_name} (invalid positions shape {positions.shape})")
             continue
+        # Transform all frames in one matmul: (F*V, 3) -> (F, V*3), as float32 so
+        # foreach_set('co') can copy each frame directly
+        frames_pos = apply_import_matrix(positions.reshape(-1, 3), import_matrix_np, dtype=np.float32)
+        frames_pos = frames_pos.reshape(frames_count, -1)
         for frame_i in range(frames_count):  # All frames as keys (Basis is static verts)
             key_name = f"{anim_name}.Frame_{frame_i+1:03d}"
-            # Transform this frame's positions
-            frame_pos = apply_import_matrix(positions[frame_i], import_matrix_np)  # Note: Use direct call (utils. not needed internally)
             # Add new key (from_mix=False to base on Basis)
             key = obj.shape_key_add(name=key_name, from_mix=False)
-            flat_pos = frame_pos.ravel()
-            key.data.foreach_set('co', flat_pos)
+            key.data.foreach_set('co', frames_pos[frame_i])
             total_keys += 1
         debug(f"Added {frames_count} keys for '{anim_name}'")
     mesh.update()
@@ -107,7 +132,8 @@ def create_shape_key_action(obj, action_name="CarAnimation"):
         return None
 
     sk_data = mesh.shape_keys
-    sk_data.animation_data_create()
+    if sk_data.animation_data is None:
+        sk_data.animation_data_create()
 
     # Create or reuse action
     action = bpy.data.actions.get(action_name)
@@ -131,7 +157,8 @@ def keyframe_shape_key_animation_as_action(obj, anim_name, frame_start=1, kps=No
         error('Object has no shape keys')
         return
     sk_data = mesh.shape_keys
-    sk_data.animation_data_create()
+    if sk_data.animation_data is None:
+        sk_data.animation_data_create()
 
     suffix = "_Action"
     if anim_name.endswith(suffix):
@@ -174,8 +201,14 @@ def keyframe_shape_key_animation_as_action(obj, anim_name, frame_start=1, kps=No
     except AttributeError:
         warn(f"Could not set active action '{action.name}' (likely driven by NLA). Continuing update...")
 
-    key_blocks = [kb for kb in sk_data.key_blocks if re.match(fr"^{re.escape(anim_name)}\.Frame_\d+", kb.name)]
-    key_blocks.sort(key=lambda kb: kb.name)
+    # Sort by the parsed frame number; names are zero-padded to 3 digits, so a
+    # name sort breaks past Frame_999
+    prefix = f"{anim_name}.Frame_"
+    plen = len(prefix)
+    numbered = [(int(kb.name[plen:]), kb) for kb in sk_data.key_blocks
+                if kb.name.startswith(prefix) and kb.name[plen:].isdecimal()]
+    numbered.sort(key=lambda item: item[0])
+    key_blocks = [kb for _, kb in numbered]
     if not key_blocks:
         warn(f"No shape keys found for animation '{anim_name}'")
         return
@@ -184,20 +217,15 @@ def keyframe_shape_key_animation_as_action(obj, anim_name, frame_start=1, kps=No
     
     debug(f"Creating Action '{action_name}' for '{anim_name}' (Absolute: {use_absolute}, KPS Timing: {use_kps_timing})")
 
+    # Game frame i lands on Blender frame frame_start + i * frame_step
+    frame_times = frame_start + np.arange(num_frames, dtype=np.float64) * frame_step
+
     if use_absolute:
         # Absolute Path: Single F-Curve for 'eval_time'
         fc = fc_storage.fcurves.new(data_path='eval_time', index=-1)
-        current_frame = float(frame_start)
-
-        for i in range(num_frames):
-            kb = key_blocks[i]
-            # In absolute mode, ShapeKey.frame is its "address" on the timeline
-            kp = fc.keyframe_points.insert(current_frame, kb.frame)
-            kp.interpolation = 'LINEAR'
-            kp.handle_left_type = 'VECTOR'
-            kp.handle_right_type = 'VECTOR'
-            current_frame += frame_step
-
+        # In absolute mode, ShapeKey.frame is its "address" on the timeline
+        key_frames = np.array([kb.frame for kb in key_blocks], dtype=np.float32)
+        _add_keyframes(fc, frame_times, key_frames, 'LINEAR', vector_handles=True)
         fc.update()
     else:
         # Relative Path: F-Curve for every shape key
@@ -205,7 +233,10 @@ def keyframe_shape_key_animation_as_action(obj, anim_name, frame_start=1, kps=No
         reference_key = sk_data.reference_key
         all_keys = [kb for kb in sk_data.key_blocks if kb != reference_key]
         group_keys = key_blocks
-        other_keys = [kb for kb in all_keys if kb not in group_keys]
+        # Key block names are unique; a name set avoids the list scan per key
+        # (id() can't be used: each key_blocks iteration yields new wrappers)
+        group_names = {kb.name for kb in group_keys}
+        other_keys = [kb for kb in all_keys if kb.name not in group_names]
 
         # Create F-Curves upfront for all relevant keys (one per shape key)
         fcurves = {}
@@ -214,66 +245,31 @@ def keyframe_shape_key_animation_as_action(obj, anim_name, frame_start=1, kps=No
             fc = fc_storage.fcurves.new(data_path=data_path, index=-1)
             fcurves[kb.name] = fc
 
-        current_frame = float(frame_start)
-
         # Initial State (Frame 0 of animation):
         # 1. Force all "Other" keys to 0 (CONSTANT) so they don't interfere
         # 2. Set First Frame of animation to 1.0
         # 3. Set Remaining Frames of animation to 0.0
-
         for kb in other_keys:
-            kp = fcurves[kb.name].keyframe_points.insert(current_frame, 0.0)
-            kp.interpolation = 'CONSTANT'
-
-        # Set first key to 1.0
-        kp = fcurves[group_keys[0].name].keyframe_points.insert(current_frame, 1.0)
-        kp.interpolation = 'LINEAR'
-        kp.handle_left_type = 'VECTOR'
-        kp.handle_right_type = 'VECTOR'
-
-        # Set all other group keys to 0.0 at start to ensure they start from nothing
-        for kb in group_keys[1:]:
-            kp = fcurves[kb.name].keyframe_points.insert(current_frame, 0.0)
-            kp.interpolation = 'LINEAR'
-            kp.handle_left_type = 'VECTOR'
-            kp.handle_right_type = 'VECTOR'
+            _add_keyframes(fcurves[kb.name], frame_times[:1], (0.0,), 'CONSTANT')
 
         # Animate the sequence
-        # Logic: Cross-fade. At each step, the previous key goes to 0, current goes to 1.
-
-        prev_key = group_keys[0] 
-
-        for i in range(1, num_frames):
-            prev_frame_time = current_frame
-            current_frame += frame_step
-            curr_key = group_keys[i]
-
-            # Previous key fades out to 0
-            kp_prev = fcurves[prev_key.name].keyframe_points.insert(current_frame, 0.0)
-            kp_prev.interpolation = 'LINEAR'
-            kp_prev.handle_left_type = 'VECTOR'
-            kp_prev.handle_right_type = 'VECTOR'
-
-            # Current key ANCHOR: Force it to be 0 at the previous frame
-            # This prevents it from ramping up all the way from the start of the animation
-            kp_curr_anchor = fcurves[curr_key.name].keyframe_points.insert(prev_frame_time, 0.0)
-            kp_curr_anchor.interpolation = 'LINEAR'
-            kp_curr_anchor.handle_left_type = 'VECTOR'
-            kp_curr_anchor.handle_right_type = 'VECTOR'
-
-            # Current key fades in to 1
-            kp_curr = fcurves[curr_key.name].keyframe_points.insert(current_frame, 1.0)
-            kp_curr.interpolation = 'LINEAR'
-            kp_curr.handle_left_type = 'VECTOR'
-            kp_curr.handle_right_type = 'VECTOR'
-
-            prev_key = curr_key
+        # Logic: Cross-fade. Key i is anchored to 0 at the start and at the
+        # previous game frame, peaks at 1 on its own frame, and fades back to 0
+        # on the next one. Each curve's keys are known up front, so they are
+        # written in one batch instead of one insert() per keyframe
+        for i, kb in enumerate(group_keys):
+            idx = [j for j in sorted({0, i - 1, i, i + 1}) if 0 <= j < num_frames]
+            values = [1.0 if j == i else 0.0 for j in idx]
+            _add_keyframes(fcurves[kb.name], frame_times[idx], values, 'LINEAR', vector_handles=True)
 
         # Update all curves
         for fc in fcurves.values():
             fc.update()
 
-    return action
+    # Keys span the first to the last game frame in both paths; return that
+    # range (as stored float32 keys, truncated like get_action_frame_range)
+    # so callers don't have to walk the keyframes again
+    return action, int(frame_start), int(np.float32(frame_times[-1]))
 
 @timed('push_shape_key_action_to_nla')
 def push_shape_key_action_to_nla(obj, strip_name=None, frame_start=1, frame_end=None):
@@ -330,37 +326,29 @@ def auto_create_shape_key_actions_from_car(obj, frame_step=1, parsed_animations=
         info('No shape keys on object; skipping animation setup.')
         return
     sk_data = mesh.shape_keys
-    names = [kb.name for kb in sk_data.key_blocks if '.' in kb.name]
 
     # Create KPS lookup map if animations provided
-    kps_map = {}
-    if parsed_animations:
-        for anim in parsed_animations:
-            kps_map[anim['name']] = anim['kps']
-
-    # Preserve order: iterate names, extract base, add to list if not seen
-    base_names = []
-    seen = set()
-    for n in names:
-        if '.Frame_' in n:
-            base = n.split('.Frame_')[0]
-            if base not in seen:
-                seen.add(base)
-                base_names.append(base)
+    kps_map = {anim['name']: anim['kps'] for anim in parsed_animations} if parsed_animations else {}
+    get_kps = kps_map.get
+
+    # Ordered dedupe of "<base>.Frame_###" names in a single pass
+    base_names = list(dict.fromkeys(
+        kb.name.split('.Frame_', 1)[0] for kb in sk_data.key_blocks if '.Frame_' in kb.name
+    ))
 
     if not base_names:
         info('No animation-style shape keys found (no .Frame_### pattern).')
         return
     debug(f"Found {len(base_names)} animation groups: {base_names}")
 
-    actions = []
+    action_ranges = []  # (anim_name, action, start_frame, end_frame)
     for anim_name in base_names:
         debug(f"Processing animation '{anim_name}'...")
         # Retrieve KPS from map or default to None
-        anim_kps = kps_map.get(anim_name)
+        anim_kps = get_kps(anim_name)
 
         # Note: frame_step is now calculated internally based on KPS
-        action = keyframe_shape_key_animation_as_action(
+        result = keyframe_shape_key_animation_as_action(
             obj, 
             anim_name, 
             frame_start=1, 
@@ -368,32 +356,34 @@ def auto_create_shape_key_actions_from_car(obj, frame_step=1, parsed_animations=
             use_absolute=use_absolute, 
             use_kps_timing=use_kps_timing
         )
-        if action:
-            actions.append(action)
+        if result:
+            action_ranges.append((anim_name, *result))
+    actions = [action for _, action, _, _ in action_ranges]
     # Batch NLA push: Inline overlap checks per action (no manual indexing)
     try:
         anim_data = sk_data.animation_data
         if actions:
             nla_tracks = anim_data.nla_tracks
             track = None
+            last_end = float('-inf')  # frame_end of the last strip on `track`
             num_tracks_used = 0
             # Reverse order so first animation in list becomes the top-most NLA track
             # (Tracks are added bottom-to-top, 0..N)
-            for action in reversed(actions):
-                strip_name = action.name.replace('_Action', '')
-                start_frame, _ = get_action_frame_range(action)
+            for strip_name, action, start_frame, _ in reversed(action_ranges):
                 
                 # Get last track or create first
                 if track is None:
                     if nla_tracks:
                         track = nla_tracks[-1]
+                        if track.strips:
+                            last_end = track.strips[-1].frame_end
                     else:
                         track = nla_tracks.new()
                         track.name = strip_name
                         num_tracks_used += 1
                 
                 # Overlap check: If last strip ends after start_frame, new track
-                if track.strips and track.strips[-1].frame_end > start_frame:
+                if last_end > start_frame:
                     track = nla_tracks.new()
                     track.name = f'{strip_name}.{num_tracks_used + 1:03d}'
                     num_tracks_used += 1
@@ -401,17 +391,21 @@ def auto_create_shape_key_actions_from_car(obj, frame_step=1, parsed_animations=
                 # Add strip
                 strip = track.strips.new(strip_name, start_frame, action)
                 strip.use_sync_length = True  # Tighten eval for discrete steps
+                # Blender sizes the strip from the action (at least 1 frame),
+                # so read its end from the strip in hand
+                last_end = strip.frame_end
             
             anim_data.action = None  # Clear active action
             debug(f"Pushed {len(actions)} actions to NLA batch (using {num_tracks_used} tracks).")
     except Exception as e:
         warn(f"NLA batch push failed (non-fatal): {e}")
-        import traceback
-        traceback.print_exc()  # Log full stack for debug (remove if noisy) 
+        # Full stack only in debug mode; formatting it is skipped otherwise
+        if get_debug_mode():
+            import traceback
+            debug(traceback.format_exc())
     
-    # Single update at end (key for perf)
-    bpy.context.view_layer.update()
-    bpy.context.scene.frame_set(bpy.context.scene.frame_current)
+    # Pushing strips and clearing the active action already tag the shape keys
+    # for re-evaluation on the next depsgraph update, so no frame_set is needed
     info('Completed all animations.')
     return actions
 
@@ -424,11 +418,38 @@ def get_action_frame_range(action):
     if not all_fcurves:
         return (1, 1)
 
-    frames = [kp.co[0] for fc in all_fcurves for kp in fc.keyframe_points]
-    if not frames:
+    # Pull each curve's (frame, value) pairs in one foreach_get call
+    lo, hi = None, None
+    for fc in all_fcurves:
+        count = len(fc.keyframe_points)
+        if count == 0:
+            continue
+        co = np.empty(count * 2, dtype=np.float32)
+        fc.keyframe_points.foreach_get('co', co)
+        frames = co[0::2]
+        fc_lo, fc_hi = float(frames.min()), float(frames.max())
+        lo = fc_lo if lo is None else min(lo, fc_lo)
+        hi = fc_hi if hi is None else max(hi, fc_hi)
+    if lo is None:
         return (1, 1)
         
-    return (int(min(frames)), int(max(frames)))
+    return (int(lo), int(hi))
+
+def _write_wav_mono16(path, data, sample_rate=22050):
+    """
+    Write mono 16-bit PCM samples as a WAV file: a 44-byte RIFF header, then
+    the samples streamed straight from the array (no tobytes() copy).
+    """
+    samples = np.asarray(data).astype('<i2', copy=False)
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + samples.nbytes, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,  # PCM, mono, 16-bit
+        b'data', samples.nbytes,
+    )
+    with open(path, 'wb') as f:
+        f.write(header)
+        samples.tofile(f)
 
 def import_car_sounds(self, sounds, model_name, context):
     imported_sounds = []
@@ -442,12 +463,7 @@ def import_car_sounds(self, sounds, model_name, context):
         with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
             temp_path = temp_file.name
         try:
-            with wave.open(temp_path, 'wb') as wf:
-                wf.setnchannels(1)  # Mono
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(22050)
-                wf.setnframes(data.size)
-                wf.writeframes(data.tobytes())
+            _write_wav_mono16(temp_path, data)
             # Load into Blender
             sound_block = bpy.data.sounds.load(temp_path)
             # Set the name before doing anything else
@@ -477,6 +493,8 @@ def associate_sounds_with_animations(self, obj, animations, cross_ref, imported_
 
     # If actions are not passed directly, fall back to the old lookup method
     action_list = actions or bpy.data.actions
+    # Name -> action once, instead of a linear search per animation
+    action_by_name = {act.name: act for act in action_list}
 
     for anim_idx, anim in enumerate(animations):
         if anim_idx >= len(cross_ref):
@@ -490,7 +508,7 @@ def associate_sounds_with_animations(self, obj, animations, cross_ref, imported_
         action_name = f"{anim['name']}_Action"
         
         # Find the action in the provided list or the fallback list
-        action = next((act for act in action_list if act.name == action_name), None)
+        action = action_by_name.get(action_name)
 
         if action:
             # Use the PointerProperty registered on bpy.types.Action
@@ -521,38 +539,47 @@ def rescale_standard_action(action, kps, scene_fps):
     
     debug(f"Rescaling '{action.name}' to {kps} KPS (Step: {frame_step:.2f})")
 
-    # 1. Collect all unique frame times
-    unique_frames = set()
+    # 1. Collect all keyframe and handle coordinates, one foreach_get each
+    curve_data = []
     for fc in all_fcurves:
-        for kp in fc.keyframe_points:
-            unique_frames.add(kp.co[0])
-    
-    sorted_frames = sorted(list(unique_frames))
-    if not sorted_frames:
+        points = fc.keyframe_points
+        count = len(points)
+        co = np.empty(count * 2, dtype=np.float32)
+        hl = np.empty(count * 2, dtype=np.float32)
+        hr = np.empty(count * 2, dtype=np.float32)
+        points.foreach_get('co', co)
+        points.foreach_get('handle_left', hl)
+        points.foreach_get('handle_right', hr)
+        curve_data.append((fc, co, hl, hr))
+
+    sorted_frames = np.unique(np.concatenate([co[0::2] for _, co, _, _ in curve_data]))
+    if sorted_frames.size == 0:
         return
 
-    start_frame = sorted_frames[0]
+    start_frame = float(sorted_frames[0])
     
     # 2. Build Mapping: Old Time -> New Time
     # We treat the existing sorted frames as indices 0, 1, 2...
-    frame_map = {}
-    for i, old_frame in enumerate(sorted_frames):
-        new_frame = start_frame + (i * frame_step)
-        frame_map[old_frame] = new_frame
+    new_frames = start_frame + np.arange(sorted_frames.size, dtype=np.float64) * frame_step
 
     # 3. Apply Mapping
-    for fc in all_fcurves:
-        for kp in fc.keyframe_points:
-            old_time = kp.co[0]
-            if old_time in frame_map:
-                new_time = frame_map[old_time]
-                kp.co[0] = new_time
-                
-                # Shift handles to preserve relative offset
-                # (Simple shift; does not scale handle influence, effectively making curves 'sharper' if slowing down)
-                kp.handle_left[0] = new_time + (kp.handle_left[0] - old_time)
-                kp.handle_right[0] = new_time + (kp.handle_right[0] - old_time)
-
+    for fc, co, hl, hr in curve_data:
+        if co.size == 0:
+            fc.update()
+            continue
+        old_times = co[0::2].astype(np.float64)
+        new_times = new_frames[np.searchsorted(sorted_frames, co[0::2])]
+
+        # Shift handles to preserve relative offset
+        # (Simple shift; does not scale handle influence, effectively making curves 'sharper' if slowing down)
+        hl[0::2] = new_times + (hl[0::2] - old_times)
+        hr[0::2] = new_times + (hr[0::2] - old_times)
+        co[0::2] = new_times
+
+        points = fc.keyframe_points
+        points.foreach_set('co', co)
+        points.foreach_set('handle_left', hl)
+        points.foreach_set('handle_right', hr)
         fc.update()
         
     action["carnivores_kps"] = kps
@@ -583,9 +610,11 @@ def get_active_animation_data(obj):
         return obj_anim
 
 @timed('calculate_vertex_group_centroids')
-def calculate_vertex_group_centroids(obj):
+def calculate_vertex_group_centroids(obj, group_weights=None, v_pos=None):
     """
     Calculates the weighted centroid for each vertex group.
+    group_weights: optional precomputed io_utils.vertex_group_weights() arrays.
+    v_pos: optional (V, 3) float32 vertex positions already read by the caller.
     Returns: list of (x, y, z) positions in group order.
     """
     mesh = obj.data
@@ -593,32 +622,35 @@ def calculate_vertex_group_centroids(obj):
     if num_groups == 0:
         return []
 
-    # Initialize accumulators
-    centroids = np.zeros((num_groups, 3), dtype=np.float64)
-    weights_sum = np.zeros(num_groups, dtype=np.float64)
-
     # Get vertex positions
     v_count = len(mesh.vertices)
-    v_pos = np.empty(v_count * 3, dtype=np.float32)
-    mesh.vertices.foreach_get('co', v_pos) # FIXED: Use foreach_get, not foreach_set
-    v_pos = v_pos.reshape((v_count, 3))
-
-    # Process weights
-    for v_idx, v in enumerate(mesh.vertices):
-        for g in v.groups:
-            g_idx = g.group
-            w = g.weight
-            if g_idx < num_groups:
-                centroids[g_idx] += v_pos[v_idx] * w
-                weights_sum[g_idx] += w
+    if v_pos is None:
+        v_pos = np.empty(v_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', v_pos) # FIXED: Use foreach_get, not foreach_set
+        v_pos = v_pos.reshape((v_count, 3))
+
+    # Process weights: weighted sums per group via bincount over the flat
+    # (vertex, group, weight) memberships
+    if group_weights is None:
+        group_weights = io_utils.vertex_group_weights(mesh)
+    v_idx, g_idx, weights = group_weights
+    valid = g_idx < num_groups
+    v_idx, g_idx = v_idx[valid], g_idx[valid]
+    weights = weights[valid].astype(np.float64)
+
+    weights_sum = np.bincount(g_idx, weights=weights, minlength=num_groups)
+    weighted_pos = v_pos[v_idx] * weights[:, None]
+    centroids = np.column_stack([
+        np.bincount(g_idx, weights=weighted_pos[:, axis], minlength=num_groups)
+        for axis in range(3)
+    ])
 
     # Avoid division by zero (for groups with no assigned vertices)
-    for i in range(num_groups):
-        if weights_sum[i] > 0:
-            centroids[i] /= weights_sum[i]
-        else:
-            # Fallback to mesh center if group is empty
-            centroids[i] = np.mean(v_pos, axis=0) if v_count > 0 else (0, 0, 0)
+    has_weight = weights_sum > 0
+    np.divide(centroids, weights_sum[:, None], out=centroids, where=has_weight[:, None])
+    if not has_weight.all():
+        # Fallback to mesh center if group is empty
+        centroids[~has_weight] = v_pos.mean(axis=0) if v_count > 0 else 0.0
 
     return centroids.tolist()
 
@@ -633,9 +665,7 @@ def infer_hierarchy_mst(centroids, bone_names=None):
     if num_bones <= 1:
         return [-1] * num_bones
 
-    parents = [-1] * num_bones
-    connected = [False] * num_bones
-    all_pos = np.array(centroids)
+    all_pos = np.asarray(centroids, dtype=np.float64)
     
     # 1. Identify Root
     # Preference: Bone named 'floor' (case insensitive) or index 0.
@@ -646,40 +676,43 @@ def infer_hierarchy_mst(centroids, bone_names=None):
                 root_idx = i
                 break
     
-    connected[root_idx] = True
-    
-    # 2. Symmetry-Aware MST
+    # 2. Symmetry-Aware MST (Prim's, O(N^2)): keep each unconnected bone's
+    # cheapest link into the tree and refresh it only against the newest bone.
+    # Side of the X center plane: +1 / -1, or 0 inside the 0.05 margin that
+    # lets spine bones connect even if slightly off-center
+    x = all_pos[:, 0]
+    side = (x > 0.05).astype(np.int8) - (x < -0.05).astype(np.int8)
+
+    parents = np.full(num_bones, -1, dtype=np.int64)
+    connected = np.zeros(num_bones, dtype=bool)
+    best_dist = np.full(num_bones, np.inf)
+    best_parent = np.full(num_bones, -1, dtype=np.int64)
+
+    newest = root_idx
     for _ in range(num_bones - 1):
-        min_dist = float('inf')
-        best_pair = (-1, -1) # (parent, child) 
-        
-        for i in range(num_bones):
-            if not connected[i]: continue
-            
-            p_pos = all_pos[i]
-            for j in range(num_bones):
-                if connected[j]: continue
-                
-                c_pos = all_pos[j]
-                
-                # Base distance
-                dist = np.linalg.norm(p_pos - c_pos)
-                
-                # Symmetry Penalty: Prevent cross-leg connections
-                # Penalize if child and parent are on opposite sides of X center plane
-                # (Using 0.05 margin to allow spine bones to connect even if slightly off-center)
-                if (p_pos[0] > 0.05 and c_pos[0] < -0.05) or (p_pos[0] < -0.05 and c_pos[0] > 0.05):
-                    dist *= 50.0 # High penalty
-                
-                if dist < min_dist:
-                    min_dist = dist
-                    best_pair = (i, j)
-        
-        if best_pair[1] != -1:
-            parents[best_pair[1]] = best_pair[0]
-            connected[best_pair[1]] = True
+        connected[newest] = True
+
+        # Base distance from the newest tree bone to every bone
+        dist = np.linalg.norm(all_pos - all_pos[newest], axis=1)
+        # Symmetry Penalty: Prevent cross-leg connections
+        dist[side * side[newest] < 0] *= 50.0 # High penalty
+
+        # Ties keep the lower parent index, as the old (parent, child) scan did
+        better = ~connected & ((dist < best_dist) | ((dist == best_dist) & (newest < best_parent)))
+        best_dist[better] = dist[better]
+        best_parent[better] = newest
+
+        candidates = np.where(connected, np.inf, best_dist)
+        min_dist = candidates.min()
+        if not min_dist < np.inf:
+            break
+        tied = np.flatnonzero(candidates == min_dist)
+        child = tied[np.argmin(best_parent[tied])]
+
+        parents[child] = best_parent[child]
+        newest = child
             
-    return parents
+    return parents.tolist()
 
 @timed('reconstruct_armature')
 def reconstruct_armature(obj):
@@ -696,26 +729,29 @@ def reconstruct_armature(obj):
 
     info(f"Reconstructing rig for '{obj.name}'...")
 
+    # Vertex positions and group memberships are read once and shared by the
+    # centroid pass and the armature/owner pass below
+    mesh = obj.data
+    v_count = len(mesh.vertices)
+    v_pos = np.empty(v_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', v_pos) # FIXED: Use foreach_get
+    v_pos = v_pos.reshape((v_count, 3))
+    group_weights = io_utils.vertex_group_weights(mesh)
+
     # 1. Calculate Centroids
-    centroids = calculate_vertex_group_centroids(obj)
+    centroids = calculate_vertex_group_centroids(obj, group_weights, v_pos)
     bone_names = [vg.name for vg in obj.vertex_groups]
     
     # 2. Infer Hierarchy
     parents = infer_hierarchy_mst(centroids, bone_names=bone_names)
     
     # 3. Create Armature
-    mesh = obj.data
-    v_count = len(mesh.vertices)
-    v_pos = np.empty(v_count * 3, dtype=np.float32)
-    mesh.vertices.foreach_get('co', v_pos) # FIXED: Use foreach_get
-    v_pos = v_pos.reshape((v_count, 3))
-    
-    v_owners = np.zeros(v_count, dtype=np.int32)
-    for v_idx, v in enumerate(mesh.vertices):
-        if v.groups:
-            v_owners[v_idx] = max(v.groups, key=lambda g: g.weight).group
-        else:
-            v_owners[v_idx] = -1
+    # Dominant group per vertex; vertices without groups stay -1
+    v_owners = np.full(v_count, -1, dtype=np.int32)
+    v_idx, g_idx, weights = group_weights
+    if v_idx.size:
+        winners = io_utils.dominant_memberships(v_idx, weights)
+        v_owners[v_idx[winners]] = g_idx[winners]
 
     arm_obj = io_utils.create_armature(
         bone_names,
@@ -1,9 +1,16 @@
+import os
 import time
 import functools
 from .logger import debug
 
+# Timing wrappers are decided at import time. Set CARNIVORESIO_TIMING=0 to
+# return the decorated functions unwrapped (no perf_counter/log per call).
+_TIMING_ENABLED = os.environ.get("CARNIVORESIO_TIMING", "1").strip() not in ("0", "", "false", "False")
+
 def timed(label="Function", is_operator=False):
     def decorator(func):
+        if not _TIMING_ENABLED:
+            return func
         if is_operator:
             @functools.wraps(func)
             def wrapper(self, context, *args, **kwargs):
@@ -4,6 +4,13 @@ import bmesh
 from ..core.constants import FACE_FLAG_OPTIONS
 from .common import timed
 
+# Flag bits in FACE_FLAG_OPTIONS order, for per-bit counting
+_FLAG_BITS_LIST = [bit for bit, _, _ in FACE_FLAG_OPTIONS]
+
+def _count_flag_bits(vals):
+    """Return a dict bit -> number of values having that bit set."""
+    return {bit: int(np.count_nonzero(vals & bit)) for bit in _FLAG_BITS_LIST}
+
 @timed("assign_face_flag")
 def assign_face_flag_int(mesh: bpy.types.Mesh, face_flags, attr_name="3df_flags"):
     # Create or get the attribute
@@ -14,13 +21,16 @@ def assign_face_flag_int(mesh: bpy.types.Mesh, face_flags, attr_name="3df_flags"
 
 @timed("get_face_attribute_int")
 def get_face_attribute_int(mesh, attr_name, default=0):
-    """Read an integer face attribute into a NumPy array; return default if missing."""
+    """
+    Read an integer face attribute into an int32 NumPy array; return default if missing.
+    Values are returned as stored (no uint16 copy); assigning into a '<u2' field narrows them.
+    """
     attr = mesh.attributes.get(attr_name)
     if not attr or attr.domain != 'FACE' or attr.data_type != 'INT':
-        return np.full(len(mesh.polygons), default, dtype=np.uint16)
+        return np.full(len(mesh.polygons), default, dtype=np.int32)
     vals = np.empty(len(mesh.polygons), dtype=np.int32)
     attr.data.foreach_get("value", vals)
-    return vals.astype(np.uint16)
+    return vals
 
 def count_flag_hits(obj, attr_name="3df_flags"):
     """
@@ -28,7 +38,7 @@ def count_flag_hits(obj, attr_name="3df_flags"):
       - counts: dict mapping bit -> number of faces (numerator)
       - total: number of selected faces (EDIT mode) or total faces (OBJECT mode)
     """
-    counts = {bit: 0 for bit, _, _ in FACE_FLAG_OPTIONS}
+    counts = dict.fromkeys(_FLAG_BITS_LIST, 0)
     mesh = obj.data
     face_count = len(mesh.polygons)
     if face_count == 0:
@@ -41,21 +51,15 @@ def count_flag_hits(obj, attr_name="3df_flags"):
     if obj.mode == 'EDIT':
         # Use BMesh for EDIT mode to ensure UI updates correctly
         bm = bmesh.from_edit_mesh(mesh)
-        bm.faces.ensure_lookup_table()
         layer = bm.faces.layers.int.get(attr_name)
         if not layer:
             return counts, 0
 
-        total = 0
-        for f in bm.faces:
-            if not f.select:
-                continue
-            total += 1
-            val = f[layer]
-            for bit in counts:
-                if val & bit:
-                    counts[bit] += 1
-        return counts, total
+        # mesh.polygons/attributes are stale while in EDIT mode (update_edit_mesh
+        # does not write them back), so gather selected values from BMesh in a
+        # single pass and do the per-bit counting vectorized
+        vals = np.fromiter((f[layer] for f in bm.faces if f.select), dtype=np.int32)
+        return _count_flag_bits(vals), int(vals.size)
     else:
         # In OBJECT mode, always use ALL faces, ignoring any prior selection
         total = face_count
@@ -64,20 +68,18 @@ def count_flag_hits(obj, attr_name="3df_flags"):
         attr.data.foreach_get("value", vals)
 
         # Count flags for all faces
-        for bit in counts:
-            counts[bit] = int(np.count_nonzero((vals & bit) != 0))
-
-        return counts, total
+        return _count_flag_bits(vals), total
 
 @timed("get_selected_face_indices")    
 def get_selected_face_indices(obj):
     """Return numpy array of selected face indices (int32). In OBJECT mode, return all faces if none selected."""
     mesh = obj.data
     if obj.mode == 'EDIT':
+        # mesh.polygons is stale in EDIT mode, so read selection from BMesh;
+        # iteration order is face order, so no lookup table or f.index is needed
         bm = bmesh.from_edit_mesh(mesh)
-        bm.faces.ensure_lookup_table()
-        sel = [f.index for f in bm.faces if f.select]
-        return np.array(sel, dtype=np.int32)
+        sel_flags = np.fromiter((f.select for f in bm.faces), dtype=np.bool_, count=len(bm.faces))
+        return np.flatnonzero(sel_flags).astype(np.int32)
     else:
         face_count = len(mesh.polygons)
         if face_count == 0:
@@ -93,6 +95,7 @@ def bulk_modify_flag(mesh, selected_indices, mask, op):
     Perform a bulk modify on mesh.attributes['3df_flags'].
     Returns the number of faces actually changed.
     op: 'set' | 'clear' | 'toggle'
+    Only tags the mesh; callers should call mesh.update() once after a batch.
     """
     attr = mesh.attributes.get("3df_flags")
     if not attr:
@@ -110,24 +113,27 @@ def bulk_modify_flag(mesh, selected_indices, mask, op):
     vals = np.empty(face_count, dtype=np.int32)
     attr.data.foreach_get("value", vals)
 
-    # Copy the portion we will compare to compute changed count
-    before_sel = vals[selected_indices].copy()
-
+    # Single gather, modify the gathered copy in place, single scatter.
+    # The changed count follows from the old values and the op, so no
+    # before/after comparison is needed
+    sel_vals = vals[selected_indices]
     if op == 'set':
-        vals[selected_indices] |= mask
+        changed = int(np.count_nonzero((sel_vals & mask) != mask))
+        sel_vals |= mask
     elif op == 'clear':
-        vals[selected_indices] &= ~mask
+        changed = int(np.count_nonzero(sel_vals & mask))
+        sel_vals &= ~mask
     elif op == 'toggle':
-        vals[selected_indices] ^= mask
+        changed = int(selected_indices.size) if mask else 0
+        sel_vals ^= mask
     else:
         raise ValueError(f"Unknown op: {op}")
+    vals[selected_indices] = sel_vals
 
     # Write back in a single C call
     attr.data.foreach_set("value", vals)
-    mesh.update()
+    mesh.update_tag()
 
-    after_sel = vals[selected_indices]
-    changed = int(np.count_nonzero(before_sel != after_sel))
     return changed
 
 def get_flag_color(flags):
@@ -161,6 +167,31 @@ def get_flag_color(flags):
 
     return color
 
+# Tint per flag bit, blended in this order: color = (color + tint) / 2
+_FLAG_TINTS = [
+    (1 << 0, np.array([1.0, 0.0, 1.0, 1.0])), # Magenta
+    (1 << 1, np.array([0.0, 1.0, 0.0, 1.0])), # Green
+    (1 << 2, np.array([0.0, 0.0, 1.0, 1.0])), # Blue
+    (1 << 3, np.array([1.0, 1.0, 0.0, 1.0])), # Yellow
+    (1 << 4, np.array([1.0, 0.0, 0.0, 1.0])), # Red
+    (1 << 5, np.array([0.0, 1.0, 1.0, 1.0])), # Cyan
+    (1 << 6, np.array([0.5, 0.5, 0.5, 1.0])), # Gray
+    (1 << 7, np.array([1.0, 0.5, 0.0, 1.0])), # Orange
+    (1 << 8, np.array([0.0, 0.0, 0.0, 1.0])), # Black
+]
+_FLAG_COLOR_BITS = (1 << len(_FLAG_TINTS)) - 1
+
+def _build_flag_color_lut():
+    """Return the (512, 4) float32 RGBA color of every 9-bit flag combination."""
+    lut = np.ones((_FLAG_COLOR_BITS + 1, 4), dtype=np.float32)
+    values = np.arange(_FLAG_COLOR_BITS + 1)
+    for mask, tint in _FLAG_TINTS:
+        has_bit = (values & mask) != 0
+        lut[has_bit] = (lut[has_bit] + tint) * 0.5
+    return lut
+
+_FLAG_COLOR_LUT = _build_flag_color_lut()
+
 @timed("update_flag_colors")
 def update_flag_colors(mesh):
     """
@@ -175,9 +206,10 @@ def update_flag_colors(mesh):
     if not attr_flags or attr_flags.domain != 'FACE' or attr_flags.data_type != 'INT':
         return
 
-    # Get flags as numpy array
+    # Get flags as numpy array (int32 matches the INT attribute, so foreach_get
+    # copies directly)
     face_count = len(mesh.polygons)
-    flags = np.zeros(face_count, dtype=np.int32)
+    flags = np.empty(face_count, dtype=np.int32)
     attr_flags.data.foreach_get("value", flags)
 
     # Ensure FlagColors attribute exists (Color Attribute in newer Blender)
@@ -188,35 +220,10 @@ def update_flag_colors(mesh):
     attr_colors = mesh.attributes["FlagColors"]
 
     # Calculate colors for all faces
-    # Vectorization Strategy:
-    # 1. Pre-calculate the color for every unique flag combination found?
-    #    OR just iterate. Iterating Python might be slow for high poly.
-    #    Let's try a numpy approach.
-    
-    # Construct an array of shape (face_count, 4) initialized to white
-    colors = np.ones((face_count, 4), dtype=np.float32)
-
-    # Apply tints vectorially
-    # Tints logic: color = (color + tint) / 2  => color * 0.5 + tint * 0.5
-    
-    tints_map = [
-        (1 << 0, np.array([1.0, 0.0, 1.0, 1.0])), # Magenta
-        (1 << 1, np.array([0.0, 1.0, 0.0, 1.0])), # Green
-        (1 << 2, np.array([0.0, 0.0, 1.0, 1.0])), # Blue
-        (1 << 3, np.array([1.0, 1.0, 0.0, 1.0])), # Yellow
-        (1 << 4, np.array([1.0, 0.0, 0.0, 1.0])), # Red
-        (1 << 5, np.array([0.0, 1.0, 1.0, 1.0])), # Cyan
-        (1 << 6, np.array([0.5, 0.5, 0.5, 1.0])), # Gray
-        (1 << 7, np.array([1.0, 0.5, 0.0, 1.0])), # Orange
-        (1 << 8, np.array([0.0, 0.0, 0.0, 1.0])), # Black
-    ]
-
-    for mask, tint in tints_map:
-        # Find indices where this flag is set
-        mask_indices = (flags & mask) != 0
-        if np.any(mask_indices):
-            # Apply blend
-            colors[mask_indices] = (colors[mask_indices] + tint) * 0.5
+    # Only the low 9 bits pick a color, so gather from the precomputed LUT in a
+    # single pass instead of blending each tint over the whole array
+    np.bitwise_and(flags, _FLAG_COLOR_BITS, out=flags)
+    colors = _FLAG_COLOR_LUT[flags]
 
     # Prepare Loop Colors
     # Vertex Colors are stored per Loop (Corner).
@@ -245,10 +252,15 @@ def update_flag_colors(mesh):
     # BUT `np.repeat` works on the array logic.
     
     # Let's check if loop_totals is constant? No, can be quads/tris.
-    loop_totals = np.zeros(face_count, dtype=np.int32)
-    mesh.polygons.foreach_get("loop_total", loop_totals)
-    
-    loop_colors_float = np.repeat(colors, loop_totals, axis=0)
+    # Every face has at least 3 loops, so loop_count == 3 * face_count means an
+    # all-triangle mesh (every 3DF/CAR import): repeat by a scalar and skip
+    # reading loop_total
+    if loop_count == face_count * 3:
+        loop_colors_float = np.repeat(colors, 3, axis=0)
+    else:
+        loop_totals = np.zeros(face_count, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        loop_colors_float = np.repeat(colors, loop_totals, axis=0)
     
     # Flatten to 1D array for foreach_set
     loop_colors_flat = loop_colors_float.flatten()
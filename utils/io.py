@@ -2,7 +2,6 @@ import bpy
 import mathutils
 import numpy as np
 import os
-import re
 import bmesh
 from ..core.constants import TEXTURE_WIDTH
 from .common import timed
@@ -22,11 +21,12 @@ def create_mesh_object(mesh_name, verticesTransformedPos, faces, object_name, sm
     mesh.loops.foreach_set("vertex_index", flat_faces)
     mesh.polygons.add(num_faces)
 
-    # loop_start & loop_total
+    # loop_start (stride 3, all triangles)
     starts = np.arange(0, num_faces * 3, 3, dtype=np.int32)
-    totals = np.full(num_faces, 3, dtype=np.int32)
     mesh.polygons.foreach_set("loop_start", starts)
-    mesh.polygons.foreach_set("loop_total", totals)
+    # Blender 4.0+ derives loop_total from the face offsets
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", np.full(num_faces, 3, dtype=np.int32))
 
     if np.any(face_flags):
         assign_face_flag_int(mesh, face_flags)
@@ -34,19 +34,23 @@ def create_mesh_object(mesh_name, verticesTransformedPos, faces, object_name, sm
     mesh.update(calc_edges=False)
 
     if not smooth_faces:
-        mesh.polygons.foreach_set("use_smooth", [False] * num_faces)
+        mesh.polygons.foreach_set("use_smooth", np.zeros(num_faces, dtype=np.bool_))
 
     return bpy.data.objects.new(object_name, mesh)
     
-def apply_import_matrix(vertices, import_matrix):
-    # Add homogeneous coordinate
-    homogenous = np.column_stack((vertices, np.ones(len(vertices))))
-    
-    # Batch transformation
-    transformed = homogenous @ import_matrix.T
-    
-    # Return only XYZ components
-    return transformed[:, :3]
+def apply_import_matrix(vertices, import_matrix, dtype=None, out=None):
+    # Import/export matrices are affine, so skip the homogeneous column:
+    # rotate/scale with the 3x3 block and add the translation.
+    # dtype=None keeps NumPy's promotion (float64 with a float64 matrix), which
+    # the exporters quantize from; importers pass np.float32 to match Blender's
+    # 'co' type. `out` may be a preallocated (N, 3) buffer of the result dtype.
+    import_matrix = np.asarray(import_matrix, dtype=dtype)
+    linear = np.ascontiguousarray(import_matrix[:3, :3].T)
+    translation = import_matrix[:3, 3]
+
+    out = np.matmul(np.asarray(vertices, dtype=dtype), linear, out=out)
+    out += translation
+    return out
     
 @timed("generate_names")        
 def generate_names(filepath):
@@ -65,6 +69,14 @@ def create_import_collection(object_name, parent_collection=None):
 @timed("create_vertex_groups_from_bones")
 def create_vertex_groups_from_bones(obj, bone_names, vertex_owners):
     vertex_groups_by_index = {}
+
+    # Bucket vertices by owner once instead of scanning all owners per bone
+    owners = np.asarray(vertex_owners)
+    order = np.argsort(owners, kind='stable')
+    sorted_owners = owners[order]
+    bone_ids = np.arange(len(bone_names))
+    starts = np.searchsorted(sorted_owners, bone_ids, side='left')
+    ends = np.searchsorted(sorted_owners, bone_ids, side='right')
     
     for bone_index, bone_name in enumerate(bone_names):
         if not bone_name:
@@ -75,7 +87,7 @@ def create_vertex_groups_from_bones(obj, bone_names, vertex_owners):
         vertex_groups_by_index[bone_index] = vg
         
         # Find vertices owned by this bone
-        vertex_indices = np.where(vertex_owners == bone_index)[0]
+        vertex_indices = order[starts[bone_index]:ends[bone_index]]
         if vertex_indices.size > 0:
             vg.add(vertex_indices.tolist(), 1.0, 'REPLACE')
         
@@ -151,30 +163,41 @@ def smooth_vertex_weights(obj, iterations=3, factor=0.5, joints_only=False):
 @timed("create_hooks")
 def create_hooks(bone_names, bonesTransformedPos, parent_indices, object_name, mesh_obj, target_coll):
     
-    hook_objects = {i: bpy.data.objects.new(name, None) for i, name in enumerate(bone_names)}
+    hook_objects = [bpy.data.objects.new(name, None) for name in bone_names]
+
+    # Hoist per-hook invariants out of the loop
+    locations = np.asarray(bonesTransformedPos, dtype=np.float32).tolist()
+    mesh_inverse = mesh_obj.matrix_world.inverted()
+    link = target_coll.objects.link
     
-    for i, obj in hook_objects.items():
+    for i, obj in enumerate(hook_objects):
         obj.empty_display_type = 'SPHERE'
         obj.empty_display_size = 0.1
         obj.show_in_front = True
-        # empty.matrix_world = mathutils.Matrix.Translation(bonesTransformedPos[i])
-        obj.location = bonesTransformedPos[i]
+        obj.location = locations[i]
         obj.parent = mesh_obj
-        obj.matrix_parent_inverse = mesh_obj.matrix_world.inverted()
+        obj.matrix_parent_inverse = mesh_inverse
         obj["bone_index"] = i
         # Link to custom collection
-        target_coll.objects.link(obj)
-        hook_objects[i] = obj
+        link(obj)
         
-    bpy.context.view_layer.update()
+    # The mesh parent inverse cancels the mesh transform, so each hook's world
+    # matrix is a pure translation and its inverse is known before matrix_world
+    # has been evaluated
+    inverse_cache = [mathutils.Matrix.Translation(loc)
+                     for loc in (-np.asarray(locations, dtype=np.float32)).tolist()]
 
     for i, parent_idx in enumerate(parent_indices):
-        if parent_idx != -1 and parent_idx in hook_objects:
+        if 0 <= parent_idx < len(hook_objects):
             child = hook_objects[i]
-            parent = hook_objects[parent_idx]
 
-            child.parent = parent
-            child.matrix_parent_inverse = parent.matrix_world.inverted()
+            child.parent = hook_objects[parent_idx]
+            child.matrix_parent_inverse = inverse_cache[parent_idx]
+
+    # Evaluate once so matrix_world is stored: assigning mod.object in
+    # assign_hook_modifiers resets the hook from the object's current world
+    # matrix, and an unevaluated identity would offset every hooked vertex
+    bpy.context.view_layer.update()
             
     return hook_objects
     
@@ -185,17 +208,18 @@ def create_armature(bone_names, bonesTransformedPos, parent_indices, object_name
     arm_obj = bpy.data.objects.new(f"{object_name}_ArmatureObj", arm_data)
     coll = target_coll or bpy.context.scene.collection
     coll.objects.link(arm_obj)
+    # Head vectors are built once; reading bone.head back goes through RNA
+    heads = [mathutils.Vector(p) for p in np.asarray(bonesTransformedPos, dtype=np.float32).tolist()]
+
+    # Single EDIT/OBJECT round trip; nothing below may toggle modes again
     bpy.context.view_layer.objects.active = arm_obj
     bpy.ops.object.mode_set(mode='EDIT')
     edit_bones = arm_obj.data.edit_bones
 
     # 1. Create all bones first (Heads only)
-    bone_list = []
-    for i, name in enumerate(bone_names):
-        bone = edit_bones.new(name)
-        x, y, z = bonesTransformedPos[i]
-        bone.head = (x, y, z)
-        bone_list.append(bone)
+    bone_list = [edit_bones.new(name) for name in bone_names]
+    for bone, head in zip(bone_list, heads):
+        bone.head = head
 
     # 2. Analyze Model Basis (Strict Grid Alignment)
     model_forward = mathutils.Vector((0, 1, 0)) # Default Blender Y-Forward
@@ -219,18 +243,20 @@ def create_armature(bone_names, bonesTransformedPos, parent_indices, object_name
         if (v_mean - v_center).dot(np.array(model_forward)) < 0:
             model_forward *= -1
 
-    # 3. Map children
-    children_map = {i: [] for i in range(len(bone_names))}
-    for i, parent_idx in enumerate(parent_indices):
-        if parent_idx != -1:
-            children_map[parent_idx].append(i)
+    # 3. Map children (stable sort keeps each parent's children in index order)
+    parents = np.asarray(parent_indices, dtype=np.int64)
+    child_idx = np.flatnonzero(parents != -1)
+    child_parents = parents[child_idx]
+    grouped = child_idx[np.argsort(child_parents, kind='stable')]
+    child_counts = np.bincount(child_parents, minlength=len(bone_names))
+    children_map = [c.tolist() for c in np.split(grouped, np.cumsum(child_counts)[:-1])]
 
     # 4. Global heuristics
     all_distances = []
     for i, bone in enumerate(bone_list):
         children = children_map[i]
         for c_idx in children:
-            d = (mathutils.Vector(bonesTransformedPos[c_idx]) - mathutils.Vector(bone.head)).length
+            d = (heads[c_idx] - heads[i]).length
             if d > 0.001: all_distances.append(d)
     
     global_median = np.median(all_distances) if all_distances else 0.1
@@ -243,11 +269,11 @@ def create_armature(bone_names, bonesTransformedPos, parent_indices, object_name
             bone.parent = bone_list[parent_idx]
 
         children = children_map[i]
-        my_head = mathutils.Vector(bone.head)
+        my_head = heads[i]
         
         # Priority 1: Parent-Child Chain (Standard)
         if children:
-            child_heads = [mathutils.Vector(bonesTransformedPos[c]) for c in children]
+            child_heads = [heads[c] for c in children]
             if len(children) == 1:
                 target_tail = child_heads[0]
                 dist = (target_tail - my_head).length
@@ -273,8 +299,7 @@ def create_armature(bone_names, bonesTransformedPos, parent_indices, object_name
         else:
             bone.use_connect = False
             if parent_idx != -1:
-                p_bone = bone_list[parent_idx]
-                p_head = mathutils.Vector(p_bone.head)
+                p_head = heads[parent_idx]
                 # Direction from parent to me
                 direction = my_head - p_head
                 if direction.length > 0.001:
@@ -301,7 +326,7 @@ def assign_armature_modifier(mesh_obj, armature_obj):
 
 @timed("assign_hook_modifiers")
 def assign_hook_modifiers(obj, hook_objects, vertex_groups_by_index):
-    for hook_obj in hook_objects.values():
+    for hook_obj in hook_objects:
         bone_index = hook_obj.get("bone_index")
         if bone_index is None:
             continue
@@ -328,16 +353,35 @@ def create_image_texture(texture, texture_height, object_name):
         width=TEXTURE_WIDTH,
         height=texture_height
     )
-    image.pixels = texture
+    # Matching float32 buffer lets foreach_set copy in one block
+    image.pixels.foreach_set(np.ascontiguousarray(texture, dtype=np.float32).ravel())
     image.pack()
     image.reload()
     
     return image
     
+# Hidden (dot-prefixed) material holding the import node graph; copied per import.
+# It has no users, so it is not saved with the .blend and is rebuilt on demand.
+_MATERIAL_TEMPLATE_NAME = ".CarnivoresIO_Material_Template"
+
 @timed("create_texture_material")   
 def create_texture_material(image, object_name):
+    template = bpy.data.materials.get(_MATERIAL_TEMPLATE_NAME)
+    if template is None:
+        template = bpy.data.materials.new(name=_MATERIAL_TEMPLATE_NAME)
+        _build_texture_material_nodes(template)
+
+    # Copying the template duplicates the node tree in one call instead of
+    # rebuilding every node and link through the Python API
+    material = template.copy()
+    material.name = f"{object_name}_Material"
+    for node in material.node_tree.nodes:
+        if node.type == 'TEX_IMAGE':
+            node.image = image
+
+    return material
 
-    material = bpy.data.materials.new(name=f"{object_name}_Material")
+def _build_texture_material_nodes(material):
     material.use_nodes = True
     nodes = material.node_tree.nodes
     links = material.node_tree.links
@@ -345,11 +389,9 @@ def create_texture_material(image, object_name):
 
     # Nodes
     image_texture = nodes.new("ShaderNodeTexImage")
-    image_texture.image = image
     image_texture.name = "Image Texture"
 
     image_texture_001 = nodes.new("ShaderNodeTexImage")
-    image_texture_001.image = image
     image_texture_001.interpolation = 'Closest'
     image_texture_001.name = "Image Texture.001"
 
@@ -415,8 +457,6 @@ def create_texture_material(image, object_name):
     links.new(diffuse_bsdf.outputs[0], mix_shader_001.inputs[1])
     links.new(mix_shader.outputs[0], mix_shader_001.inputs[2])
     
-    return material
-    
 @timed("setup_custom_world_shader") 
 def setup_custom_world_shader():
 
@@ -468,8 +508,9 @@ def setup_custom_world_shader():
 @timed("triangulated_mesh_copy")    
 def triangulated_mesh_copy(mesh):
     # Quick check: Skip triangulation if already all tris (faster for pre-tri meshes)
-    all_tris = all(p.loop_total == 3 for p in mesh.polygons)
-    if all_tris:
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    if np.all(loop_totals == 3):
         return mesh.copy()
 
     tmp = mesh.copy()
@@ -494,6 +535,9 @@ def find_texture_image(mesh_obj):
                     return img, img.size[1]
     return None, 0
 
+# Per-channel bit offsets of R, G, B in an ARGB1555 texel
+_ARGB1555_SHIFTS = np.array([10, 5, 0], dtype=np.uint16)
+
 @timed("image_to_argb1555")
 def image_to_argb1555(image):
     width, height = image.size
@@ -501,22 +545,86 @@ def image_to_argb1555(image):
         raise ValueError(f"Texture width {width} must be {TEXTURE_WIDTH} pixels.")
     
     # Get pixels and validate length
-    pixels = np.array(image.pixels[:], dtype=np.float32)
     expected_len = width * height * 4
-    if pixels.size != expected_len:
-        raise ValueError(f"Image pixel data length {pixels.size} does not match expected {expected_len} (width={width}, height={height}).")
-    
-    pixels = pixels.reshape(height, width, 4)[::-1].ravel()
-    #pixels = np.flipud(pixels).ravel()
-    #pixels = pixels.ravel()
-    
-    # Extract RGBA and convert to ARGB1555
-    r = np.clip((pixels[::4] * 31).round(), 0, 31).astype(np.uint16)
-    g = np.clip((pixels[1::4] * 31).round(), 0, 31).astype(np.uint16)
-    b = np.clip((pixels[2::4] * 31).round(), 0, 31).astype(np.uint16)
-    a = 0  # Alpha always 0 for ARGB1555
-    packed = (a << 15) | (r << 10) | (g << 5) | b
-    return packed.astype('<u2')
+    if len(image.pixels) != expected_len:
+        raise ValueError(f"Image pixel data length {len(image.pixels)} does not match expected {expected_len} (width={width}, height={height}).")
+    pixels = np.empty(expected_len, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+
+    # Quantize RGB to 5 bits in one pass over the rows in memory order
+    rgb = pixels.reshape(height, width, 4)[:, :, :3]
+    # rint rounds halves to even, matching the original .round() byte-for-byte
+    q = rgb * 31.0
+    np.rint(q, out=q)
+    np.clip(q, 0.0, 31.0, out=q)
+    q = q.astype(np.uint16)
+
+    # Shift channels into place in-place and OR-reduce (alpha always 0 for ARGB1555)
+    q <<= _ARGB1555_SHIFTS
+    packed = np.bitwise_or.reduce(q, axis=-1)
+
+    # Flip rows on the packed 16-bit result rather than the float RGBA buffer
+    return packed[::-1].astype('<u2', copy=False).ravel()
+
+def _strip_numeric_suffix(name):
+    """Strip Blender's '.###' duplicate suffix (e.g. 'Bone.001' -> 'Bone')."""
+    if len(name) >= 4 and name[-4] == '.' and name[-3:].isdecimal():
+        return name[:-4]
+    return name
+
+def vertex_group_weights(mesh):
+    """
+    Flatten vertex group memberships into parallel arrays
+    (vertex index int32, group index int32, weight float32), in vertex then
+    per-vertex group order.
+    """
+    # No bulk API exposes deform weights, so this is the only per-element loop;
+    # everything built on the flat arrays is vectorized
+    v_list, g_list, w_list = [], [], []
+    add_v, add_g, add_w = v_list.append, g_list.append, w_list.append
+    for v in mesh.vertices:
+        v_index = v.index
+        for g in v.groups:
+            add_v(v_index)
+            add_g(g.group)
+            add_w(g.weight)
+    return (np.array(v_list, dtype=np.int32),
+            np.array(g_list, dtype=np.int32),
+            np.array(w_list, dtype=np.float32))
+
+def dominant_memberships(v_idx, weights):
+    """
+    Return the indices of each vertex's highest-weight entry in flat
+    (vertex, weight) membership arrays, ordered by vertex.
+    Ties keep the earlier entry, like max() over v.groups.
+    """
+    # Sort by vertex, then weight descending; stable so ties keep group order
+    order = np.lexsort((-weights, v_idx))
+    v_sorted = v_idx[order]
+    is_first = np.ones(v_sorted.size, dtype=np.bool_)
+    is_first[1:] = v_sorted[1:] != v_sorted[:-1]
+    return order[is_first]
+
+def _assign_dominant_owners(obj, group_to_bone, vertex_owners):
+    """
+    Write into vertex_owners the bone of each vertex's highest-weight matched group.
+    group_to_bone maps vertex group index -> bone index (-1 = no match).
+    Returns the number of vertices that have groups but no matching bone.
+    """
+    v_idx, g_idx, weights = vertex_group_weights(obj.data)
+    if v_idx.size == 0:
+        return 0
+
+    bones = group_to_bone[g_idx]
+    grouped_count = np.unique(v_idx).size
+
+    matched = bones >= 0
+    v_idx, bones, weights = v_idx[matched], bones[matched], weights[matched]
+
+    winners = dominant_memberships(v_idx, weights)
+    vertex_owners[v_idx[winners]] = bones[winners]
+
+    return grouped_count - winners.size
 
 @timed("collect_bones_and_owners")
 def collect_bones_and_owners(obj, export_matrix):
@@ -530,68 +638,53 @@ def collect_bones_and_owners(obj, export_matrix):
     if obj.parent and obj.parent.type == 'ARMATURE':
         try:
             arm = obj.parent
-            bone_pos_array = np.empty((len(arm.data.bones), 3), dtype=np.float32)
+            bones = arm.data.bones
+
+            # Use bones in their own local space (relative to Armature origin), read in one call
+            bone_pos_array = np.empty(len(bones) * 3, dtype=np.float32)
+            bones.foreach_get("head_local", bone_pos_array)
+            bone_pos_array = bone_pos_array.reshape(-1, 3)
             
-            # 1. Collect Bones and Unique Positions (Armature-Space)
-            for i, bone in enumerate(arm.data.bones):
+            # 1. Collect Bones and Hierarchy (Armature-Space)
+            parent_names = []
+            for i, bone in enumerate(bones):
                 name = bone.name
                 bone_names.append(name)
-                
-                # Use bones in their own local space (relative to Armature origin)
-                bone_pos_array[i] = bone.head_local
-                
-                # Setup hierarchy
-                parent_idx = arm.data.bones.find(bone.parent.name) if bone.parent else -1
-                bone_parents.append(parent_idx)
+                parent_names.append(bone.parent.name if bone.parent else None)
                 
                 # Map for vertex ownership (Fuzzy matching support)
                 bone_index_map[name] = i
-                clean = name.rsplit('.', 1)[0] if re.match(r'.*\.\d{3}$', name) else name
+                clean = _strip_numeric_suffix(name)
                 if clean not in clean_name_map:
                     clean_name_map[clean] = []
                 clean_name_map[clean].append(i)
 
+            # Setup hierarchy through the name map (bones.find is a linear scan per bone)
+            bone_parents = [bone_index_map[p] if p is not None else -1 for p in parent_names]
+
             # Transform all bone positions at once into the final export space (Scale/Axis)
             bone_positions = apply_import_matrix(bone_pos_array, export_matrix).tolist()
 
-            # 2. Assign Vertex Owners (Dominant Weight + Fuzzy Matching)
-            unmatched_vertices = []
-            for v in obj.data.vertices:
-                winning_bone_idx = -1
-                highest_weight = -1.0
-                
-                for g in v.groups:
-                    vg_name = obj.vertex_groups[g.group].name
-                    
-                    # Exact Match
-                    target_idx = -1
-                    if vg_name in bone_index_map:
-                        target_idx = bone_index_map[vg_name]
-                    else:
-                        # Fuzzy Match (handles cases where groups or bones have different suffixes)
-                        vg_clean = vg_name.rsplit('.', 1)[0] if re.match(r'.*\.\d{3}$', vg_name) else vg_name
-                        if vg_clean in clean_name_map:
-                            target_idx = clean_name_map[vg_clean][0]
-                    
-                    if target_idx != -1:
-                        if g.weight > highest_weight:
-                            highest_weight = g.weight
-                            winning_bone_idx = target_idx
-                
-                if winning_bone_idx != -1:
-                    vertex_owners[v.index] = winning_bone_idx
-                elif v.groups:
-                    unmatched_vertices.append(v.index)
-
-            if unmatched_vertices:
-                warn(f"{len(unmatched_vertices)} vertices assigned to root bone (no matching bone found).")
-                vertex_owners[unmatched_vertices] = 0
-
-            # 3. Cleanup Names for File Format (Strip suffixes ONLY at return)
-            final_names = []
-            for name in bone_names:
-                clean = name.rsplit('.', 1)[0] if re.match(r'.*\.\d{3}$', name) else name
-                final_names.append(clean[:31])
+            # 2. Resolve each vertex group to a bone index once (not per vertex)
+            group_to_bone = np.full(len(obj.vertex_groups), -1, dtype=np.int32)
+            for vg in obj.vertex_groups:
+                # Exact Match
+                target_idx = bone_index_map.get(vg.name, -1)
+                if target_idx == -1:
+                    # Fuzzy Match (handles cases where groups or bones have different suffixes)
+                    matches = clean_name_map.get(_strip_numeric_suffix(vg.name))
+                    if matches:
+                        target_idx = matches[0]
+                group_to_bone[vg.index] = target_idx
+
+            # 3. Assign Vertex Owners (Dominant Weight + Fuzzy Matching)
+            # Unmatched vertices keep the zero-initialized root owner
+            unmatched_count = _assign_dominant_owners(obj, group_to_bone, vertex_owners)
+            if unmatched_count:
+                warn(f"{unmatched_count} vertices assigned to root bone (no matching bone found).")
+
+            # 4. Cleanup Names for File Format (Strip suffixes ONLY at return)
+            final_names = [_strip_numeric_suffix(name)[:31] for name in bone_names]
 
             return final_names, bone_positions, bone_parents, vertex_owners
 
@@ -635,18 +728,10 @@ def collect_bones_and_owners(obj, export_matrix):
                     if p_name in bone_index_map:
                         bone_parents[i] = bone_index_map[p_name]
 
-            for v in obj.data.vertices:
-                winning_idx = 0
-                max_w = -1.0
-                for g in v.groups:
-                    vg_name = obj.vertex_groups[g.group].name
-                    if vg_name in bone_index_map:
-                        if g.weight > max_w:
-                            max_w = g.weight
-                            winning_idx = bone_index_map[vg_name]
-                vertex_owners[v.index] = winning_idx
-
-            final_names = [n.rsplit('.', 1)[0] if re.match(r'.*\.\d{3}$', n) else n for n in bone_names]
+            group_to_bone = np.array([bone_index_map.get(vg.name, -1) for vg in obj.vertex_groups], dtype=np.int32)
+            _assign_dominant_owners(obj, group_to_bone, vertex_owners)
+
+            final_names = [_strip_numeric_suffix(n) for n in bone_names]
             return final_names, bone_positions, bone_parents, vertex_owners
 
     # Fallback for carbones / no bones
@@ -657,13 +742,14 @@ def collect_bones_and_owners(obj, export_matrix):
     return bone_names, bone_positions, bone_parents, vertex_owners
 
 def handle_car_owners(vertices, context):
-    non_zero_owners = vertices['owner'][vertices['owner'] > 0]
+    owners = vertices['owner']
+    non_zero_mask = owners > 0
+    non_zero_owners = owners[non_zero_mask]
     if non_zero_owners.size == 0:
         return vertices, np.array([], dtype='U32')
-    min_non_zero = np.min(non_zero_owners)
-    max_owner = int(np.max(vertices['owner']))
-    vertices['owner'][vertices['owner'] > 0] -= min_non_zero
-    vertices['owner'] = np.clip(vertices['owner'], 0, None)
-    max_owner_adjusted = int(np.max(vertices['owner']))
+    # Owners are unsigned and the shift only touches values >= min, so no clip is needed
+    min_non_zero = int(non_zero_owners.min())
+    max_owner_adjusted = int(non_zero_owners.max()) - min_non_zero
+    owners[non_zero_mask] = non_zero_owners - min_non_zero
     bone_names = np.array([f"CarBone_{i + min_non_zero}" for i in range(max_owner_adjusted + 1)], dtype='U32')
     return vertices, bone_names
\ No newline at end of file